@@ -35,6 +35,8 @@ class Alias(set):
         aliases: A single string or a list of strings.
     """
 
+    __slots__ = ()
+
     def __init__(self, *aliases):
         super().__init__(flatten(aliases))
 
@@ -29,6 +29,8 @@ from .utilities import export_to_all
 class Note(list):
     """Stores one or more strings as notes."""
 
+    __slots__ = ()
+
     def __init__(self, *notes):
         """Create a note.
 
@@ -485,10 +485,10 @@ class Part(SkidlBaseObject):
 
     def __getattr__(self, attr):
         """Normal attribute wasn't found, so check pin aliases."""
-        from skidl.netpinlist import NetPinList
 
         # Look for the attribute name in the list of pin aliases.
-        pins = [pin for pin in self if pin.aliases == attr]
+        # (Testing membership avoids building an Alias for every comparison.)
+        pins = [pin for pin in self if attr in pin.aliases]
 
         if pins:
             if len(pins) == 1:
@@ -497,6 +497,8 @@ class Part(SkidlBaseObject):
             else:
                 # Return list of pins if multiple matches were found.
                 # Return a NetPinList instead of a vanilla list so += operator works!
+                from skidl.netpinlist import NetPinList
+
                 return NetPinList(pins)
 
         # No pin aliases matched, so use the __getattr__ for the subclass.
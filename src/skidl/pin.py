@@ -211,15 +211,15 @@ class Pin(SkidlBaseObject):
         self.nets = []
         self.part = None
         self.name = ""
-        self.num = ""
         self.stub = False
         self.do_erc = True
         self.func = self.types.UNSPEC  # Pin function defaults to unspecified.
 
         # Set pin number as a random integer so that calling Pin() multiple
         # times will give pins that are distinct according to __eq__.
-        # This pin number gets overridden if the num is set in attribs.
-        self.num = random.randint(100000, sys.maxsize)
+        # Skip this if the pin number is going to be set from attribs.
+        if "num" not in attribs:
+            self.num = random.randint(100000, sys.maxsize)
 
         # Attach additional attributes to the pin.
         for k, v in list(attribs.items()):
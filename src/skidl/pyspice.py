@@ -25,6 +25,8 @@ from .logger import active_logger
 from .net import Net
 from .package import package
 from .part import TEMPLATE, Part
+# Re-exported for "from skidl.pyspice import *".
+from .pin import Pin  # noqa: F401
 from .schlib import SchLib
 from .skidl import (
     generate_netlist,
@@ -48,9 +50,18 @@ except ImportError:
 
 else:
     from skidl import SKIDL, SPICE
-    from .tools.skidl.libs.pyspice_sklib import *
+    # These are re-exported for "from skidl.pyspice import *" since they
+    # were once brought in with the library module.
+    from .tools.spice import (  # noqa: F401
+        add_part_to_circuit,
+        add_xspice_to_circuit,
+        not_implemented,
+    )
 
-    _splib = SchLib("pyspice", tool=SKIDL)  # Read-in the SPICE part library.
+    # Read-in the SPICE part library. (Don't import the library module as well
+    # because that would build a second copy of the library that's never used.)
+    _splib = SchLib("pyspice", tool=SKIDL)
+    pyspice_lib = _splib
 
     set_default_tool(SPICE)  # Set the library format for reading SKiDL libraries.
 
@@ -60,6 +71,8 @@ else:
     # Place all the PySpice parts into the namespace so they can be instantiated easily.
     _this_module = sys.modules[__name__]
     for p in _splib.get_parts():
+        # Fill-in the pins since the parts will be copied directly from the namespace.
+        p.parse()
         # Add the part name to the module namespace.
         setattr(_this_module, p.name, p)
         # Add all the part aliases to the module namespace.
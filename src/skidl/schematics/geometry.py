@@ -59,6 +59,9 @@ def to_mms(mils):
 
 @export_to_all
 class Tx:
+    # Fixed attributes make creating and reading these small, heavily-used objects cheaper.
+    __slots__ = ("a", "b", "c", "d", "dx", "dy")
+
     def __init__(self, a=1, b=0, c=0, d=1, dx=0, dy=0):
         """Create a transformation matrix.
         tx = [
@@ -142,7 +145,15 @@ class Tx:
 
     def move(self, vec):
         """Return Tx with movement vector applied."""
-        return self * Tx(dx=vec.x, dy=vec.y)
+        # Same as self * Tx(dx=vec.x, dy=vec.y) without doing the full matrix product.
+        return Tx(
+            a=self.a,
+            b=self.b,
+            c=self.c,
+            d=self.d,
+            dx=self.dx + vec.x,
+            dy=self.dy + vec.y,
+        )
 
     def rot_90cw(self):
         """Return Tx with 90-deg clock-wise rotation around (0, 0)."""
@@ -179,6 +190,8 @@ tx_flip_y = Tx(a=1, b=0, c=0, d=-1)
 
 @export_to_all
 class Point:
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """Create a Point with coords x,y."""
         self.x = x
@@ -297,6 +310,8 @@ Vector = Point
 
 @export_to_all
 class BBox:
+    __slots__ = ("min", "max")
+
     def __init__(self, *pts):
         """Create a bounding box surrounding the given points."""
         inf = float("inf")
@@ -307,21 +322,21 @@ class BBox:
     def __add__(self, obj):
         """Return the merged BBox of two BBoxes or a BBox and a Point."""
         sum_ = BBox()
-        if isinstance(obj, Point):
-            sum_.min = self.min.min(obj)
-            sum_.max = self.max.max(obj)
-        elif isinstance(obj, BBox):
-            sum_.min = self.min.min(obj.min)
-            sum_.max = self.max.max(obj.max)
-        else:
-            raise NotImplementedError
+        sum_.min = Point(self.min.x, self.min.y)
+        sum_.max = Point(self.max.x, self.max.y)
+        sum_ += obj
         return sum_
 
     def __iadd__(self, obj):
         """Update BBox bt adding another Point or BBox"""
-        sum_ = self + obj
-        self.min = sum_.min
-        self.max = sum_.max
+        if isinstance(obj, Point):
+            self.min = self.min.min(obj)
+            self.max = self.max.max(obj)
+        elif isinstance(obj, BBox):
+            self.min = self.min.min(obj.min)
+            self.max = self.max.max(obj.max)
+        else:
+            raise NotImplementedError
         return self
 
     def add(self, *objs):
@@ -14,6 +14,7 @@ from __future__ import (  # isort:skip
 )
 
 import functools
+import heapq
 import itertools
 import math
 import random
@@ -38,7 +39,7 @@ from .debug_draw import (
     draw_start,
     draw_text,
 )
-from .geometry import BBox, Point, Segment, Tx, Vector
+from .geometry import BBox, Point, Segment, Tx, Vector, tx_flip_x, tx_rot_0, tx_rot_90
 
 
 __all__ = [
@@ -84,8 +85,16 @@ class PlacementFailure(Exception):
 
 
 # Small functions for summing Points and Vectors.
-pt_sum = lambda pts: sum(pts, Point(0, 0))
-force_sum = lambda forces: sum(forces, Vector(0, 0))
+def pt_sum(pts):
+    """Sum the coordinates directly instead of making a Point for each addition."""
+    x = y = 0
+    for pt in pts:
+        x += pt.x
+        y += pt.y
+    return Point(x, y)
+
+
+force_sum = pt_sum
 
 
 def is_net_terminal(part):
@@ -182,6 +191,7 @@ def add_anchor_pull_pins(parts, nets, **options):
         nets (list): List of attractive nets between parts.
         options (dict): Dict of options and values that enable/disable functions.
     """
+    from skidl.schematics.net_terminal import NetTerminal
 
     def add_place_pt(part, pin):
         """Add the point for a pin on the placement boundary of a part."""
@@ -218,16 +228,20 @@ def add_anchor_pull_pins(parts, nets, **options):
             # Get the set of parts with pins on the net.
             net.parts = {pin.part for pin in pins}
 
-            # Add each pin as an anchor on the part that contains it and
-            # as a pull pin on all the other parts that will be pulled by this part.
+            # Add each pin as an anchor on the part that contains it.
             for pin in pins:
                 pin.part.anchor_pins[net].append(pin)
                 add_place_pt(pin.part, pin)
-                for part in net.parts - {pin.part}:
-                    # NetTerminals are pulled towards connected parts, but
-                    # those parts are not attracted towards NetTerminals.
-                    if not is_net_terminal(pin.part):
-                        part.pull_pins[net].append(pin)
+
+            # NetTerminals are pulled towards connected parts, but
+            # those parts are not attracted towards NetTerminals.
+            pulling_pins = [pin for pin in pins if not isinstance(pin.part, NetTerminal)]
+
+            # Add each pin as a pull pin on all the other parts that will be pulled by it.
+            for part in net.parts:
+                part_pull_pins = [pin for pin in pulling_pins if pin.part is not part]
+                if part_pull_pins:
+                    part.pull_pins[net].extend(part_pull_pins)
 
         # For each net, assign the centroid of the part's anchor pins for that net.
         for net in nets:
@@ -255,6 +269,55 @@ def add_anchor_pull_pins(parts, nets, **options):
             all_pull_pins.append(anchor_pull_pin)
 
 
+def get_placed_pt(pin):
+    """Return the placement point of a pin after applying its part's transformation.
+
+    The point is remembered and reused until the pin's placement point or its
+    part's transformation matrix is replaced. (Tx objects are never changed in
+    place, so a new matrix means the part moved.)
+
+    Args:
+        pin (Pin): Pin with a placement point on a part with a transformation matrix.
+
+    Returns:
+        Point: Transformed placement point. Don't modify it.
+    """
+    place_pt, tx = pin.place_pt, pin.part.tx
+    try:
+        cached_place_pt, cached_tx, pt = pin.placed_pt
+        if cached_place_pt is place_pt and cached_tx is tx:
+            return pt
+    except AttributeError:
+        pass
+    pt = place_pt * tx
+    pin.placed_pt = place_pt, tx, pt
+    return pt
+
+
+def get_placed_bbox(part):
+    """Return the placement bounding box of a part after applying its transformation.
+
+    Like get_placed_pt(), the bounding box is reused until the part's placement
+    bounding box or transformation matrix is replaced.
+
+    Args:
+        part (Part): Part (or block) with a placement bounding box and transformation matrix.
+
+    Returns:
+        BBox: Transformed placement bounding box. Don't modify it.
+    """
+    place_bbox, tx = part.place_bbox, part.tx
+    try:
+        cached_place_bbox, cached_tx, bbox = part.placed_bbox
+        if cached_place_bbox is place_bbox and cached_tx is tx:
+            return bbox
+    except AttributeError:
+        pass
+    bbox = place_bbox * tx
+    part.placed_bbox = place_bbox, tx, bbox
+    return bbox
+
+
 def save_anchor_pull_pins(parts):
     """Save anchor/pull pins for each part before they are changed."""
     for part in parts:
@@ -275,6 +338,20 @@ def restore_anchor_pull_pins(parts):
     rmv_attr(parts, ("saved_anchor_pins", "saved_pull_pins"))
 
 
+# The eight orientations of a part in the order they're tried by adjust_orientations():
+# four rotations by 90 degrees, then the same four rotations after flipping the part.
+orientations = tuple(
+    flip * rot
+    for flip in (tx_rot_0, tx_flip_x)
+    for rot in (
+        tx_rot_0,
+        tx_rot_90,
+        tx_rot_90 * tx_rot_90,
+        tx_rot_90 * tx_rot_90 * tx_rot_90,
+    )
+)
+
+
 def adjust_orientations(parts, **options):
     """Adjust orientation of parts.
 
@@ -295,31 +372,26 @@ def adjust_orientations(parts, **options):
         # Get centerpoint of part for use when doing rotations/flips.
         part_ctr = (part.place_bbox * part.tx).ctr
 
+        # Rotations/flips are done around the part's centerpoint, so move the
+        # part's centerpoint to the origin, reorient it, and then move it back.
+        tx_to_origin = part.tx.move(-part_ctr)
+        tx_from_origin = Tx(dx=part_ctr.x, dy=part_ctr.y)
+
+        # Calculate the cost of the starting orientation before any changes in orientation.
+        starting_cost = net_tension(part, **options)
+
         # Now find the orientation that has the largest decrease (or smallest increase) in cost.
-        # Go through four rotations, then flip the part and go through the rotations again.
+        # Skip the starting orientation since its cost is already known.
         best_delta_cost = float("inf")
-        calc_starting_cost = True
-        for i in range(2):
-            for j in range(4):
-
-                if calc_starting_cost:
-                    # Calculate the cost of the starting orientation before any changes in orientation.
-                    starting_cost = net_tension(part, **options)
-                    # Skip the starting orientation but set flag to process the others.
-                    calc_starting_cost = False
-                else:
-                    # Calculate the cost of the current orientation.
-                    delta_cost = net_tension(part, **options) - starting_cost
-                    if delta_cost < best_delta_cost:
-                        # Save the largest decrease in cost and the associated orientation.
-                        best_delta_cost = delta_cost
-                        best_tx = copy(part.tx)
-
-                # Proceed to the next rotation.
-                part.tx = part.tx.move(-part_ctr).rot_90cw().move(part_ctr)
+        for orientation in orientations[1:]:
+            part.tx = tx_to_origin * orientation * tx_from_origin
 
-            # Flip the part and go through the rotations again.
-            part.tx = part.tx.move(-part_ctr).flip_x().move(part_ctr)
+            # Calculate the cost of the current orientation.
+            delta_cost = net_tension(part, **options) - starting_cost
+            if delta_cost < best_delta_cost:
+                # Save the largest decrease in cost and the associated orientation.
+                best_delta_cost = delta_cost
+                best_tx = part.tx
 
         # Save the largest decrease in cost and the associated orientation.
         part.delta_cost = best_delta_cost
@@ -335,21 +407,44 @@ def adjust_orientations(parts, **options):
         # No movable parts, so exit without doing anything.
         return
 
+    # The tension on a part only changes when a part holding one of its pull pins
+    # is moved, so find the movable parts affected by moving each movable part.
+    affected_parts = {part: [] for part in movable_parts}
+    for part in movable_parts:
+        pulling_parts = {pin.part for pins in part.pull_pins.values() for pin in pins}
+        for pulling_part in pulling_parts:
+            if pulling_part in affected_parts and pulling_part is not part:
+                affected_parts[pulling_part].append(part)
+
     # Kernighan-Lin algorithm for finding near-optimal part orientations.
     # Because of the way the tension for part alignment is computed based on
     # the nearest part, it is possible for an infinite loop to occur.
     # Hence the ad-hoc loop limit.
     for iter_cnt in range(10):
+        # Find the best orientation for each part and keep the parts in a heap
+        # ordered by the decrease in cost. Ties go to the part that comes first
+        # in the list of movable parts.
+        # (Each part's latest heap entry is kept so older ones can be skipped.
+        # The entry count keeps the heap from ever comparing the parts themselves.)
+        part_index = {part: i for i, part in enumerate(movable_parts)}
+        entry_cnt = itertools.count()
+        heap_entries = {}
+        for part in movable_parts:
+            find_best_orientation(part)
+            heap_entries[part] = (part.delta_cost, part_index[part], next(entry_cnt), part)
+        heap = list(heap_entries.values())
+        heapq.heapify(heap)
+
         # Find the best part to move and move it until there are no more parts to move.
         moved_parts = []
-        unmoved_parts = movable_parts[:]
+        unmoved_parts = set(movable_parts)
         while unmoved_parts:
-            # Find the best current orientation for each unmoved part.
-            for part in unmoved_parts:
-                find_best_orientation(part)
-
-            # Find the part that has the largest decrease in cost.
-            part_to_move = min(unmoved_parts, key=lambda p: p.delta_cost)
+            # Find the part that has the largest decrease in cost. Skip heap
+            # entries for parts that were moved or whose cost has been updated.
+            entry = heapq.heappop(heap)
+            part_to_move = entry[-1]
+            if part_to_move not in unmoved_parts or heap_entries[part_to_move] is not entry:
+                continue
 
             # Reorient the part with the Tx that created the largest decrease in cost.
             part_to_move.tx = part_to_move.delta_cost_tx
@@ -358,6 +453,19 @@ def adjust_orientations(parts, **options):
             unmoved_parts.remove(part_to_move)
             moved_parts.append(part_to_move)
 
+            # Find the best current orientation for the unmoved parts whose tension
+            # was changed by moving the part.
+            for part in affected_parts[part_to_move]:
+                if part in unmoved_parts:
+                    find_best_orientation(part)
+                    heap_entries[part] = (
+                        part.delta_cost,
+                        part_index[part],
+                        next(entry_cnt),
+                        part,
+                    )
+                    heapq.heappush(heap, heap_entries[part])
+
         # Find the point at which the cost reaches its lowest point.
         # delta_cost at location i is the change in cost *before* part i is moved.
         # Start with cost change of zero before any parts are moved.
@@ -407,19 +515,21 @@ def net_tension_dist(part, **options):
             # Skip nets without pulling or anchor points.
             continue
 
+        # Get the pulling point (x,y)s once for all the anchor points.
+        pull_xys = [(pt.x, pt.y) for pt in map(get_placed_pt, pull_pins)]
+
         # Compute the net force acting on each anchor point on the part.
         for anchor_pin in anchor_pins:
             # Compute the anchor point's (x,y).
-            anchor_pt = anchor_pin.place_pt * anchor_pin.part.tx
-
-            # Find the dist from the anchor point to each pulling point.
-            dists = [
-                (anchor_pt - pp.place_pt * pp.part.tx).magnitude for pp in pull_pins
-            ]
+            anchor_pt = get_placed_pt(anchor_pin)
+            ax, ay = anchor_pt.x, anchor_pt.y
 
             # Only the closest pulling point affects the tension since that is
-            # probably where the wire routing will go to.
-            tension += min(dists)
+            # probably where the wire routing will go to. Find it using the
+            # squared distances and only take the square root of the smallest.
+            tension += math.sqrt(
+                min((x - ax) ** 2 + (y - ay) ** 2 for x, y in pull_xys)
+            )
 
     return tension
 
@@ -450,7 +560,7 @@ def net_torque_dist(part, **options):
             # Skip nets without pulling or anchor points.
             continue
 
-        pull_pin_pts = [pin.place_pt * pin.part.tx for pin in pull_pins]
+        pull_pin_pts = [get_placed_pt(pin) for pin in pull_pins]
 
         # Multiply the force exerted by point-to-point nets.
         force_mult = pt_to_pt_mult if len(pull_pin_pts) <= 1 else 1
@@ -458,7 +568,7 @@ def net_torque_dist(part, **options):
         # Compute the net torque acting on each anchor point on the part.
         for anchor_pin in anchor_pins:
             # Compute the anchor point's (x,y).
-            anchor_pt = anchor_pin.place_pt * part.tx
+            anchor_pt = get_placed_pt(anchor_pin)
 
             # Compute torque around part center from force between anchor & pull pins.
             normalize = len(pull_pin_pts)
@@ -493,9 +603,11 @@ def net_force_dist(part, **options):
 
     # Get the force multiplier applied to point-to-point nets.
     pt_to_pt_mult = options.get("pt_to_pt_mult", 1)
+    pin_normalize = options.get("pin_normalize")
 
     # Compute the total force on the part from all the anchor/pulling points on each net.
-    total_force = Vector(0, 0)
+    # (The X and Y components are accumulated separately to avoid making a Vector per net.)
+    total_x, total_y = 0, 0
 
     # Parts with a lot of pins can accumulate large net forces that move them very quickly.
     # Accumulate the number of individual net forces and use that to attenuate
@@ -503,48 +615,52 @@ def net_force_dist(part, **options):
     net_normalizer = 0
 
     # Compute the force for each net attached to the part.
-    for net in anchor_pins.keys():
-        if not anchor_pins[net] or not pull_pins[net]:
+    for net, net_anchor_pins in anchor_pins.items():
+        net_pull_pins = pull_pins[net]
+        if not net_anchor_pins or not net_pull_pins:
             # Skip nets without pulling or anchor points.
             continue
 
         # Multiply the force exerted by point-to-point nets.
-        force_mult = pt_to_pt_mult if len(pull_pins[net]) <= 1 else 1
-
-        # Initialize net force.
-        net_force = Vector(0, 0)
-
-        pin_normalizer = 0
+        force_mult = pt_to_pt_mult if len(net_pull_pins) <= 1 else 1
 
         # Compute the anchor and pulling point (x,y)s for the net.
-        anchor_pts = [pin.place_pt * pin.part.tx for pin in anchor_pins[net]]
-        pull_pts = [pin.place_pt * pin.part.tx for pin in pull_pins[net]]
-
-        # Compute the net force acting on each anchor point on the part.
-        for anchor_pt in anchor_pts:
-            # Sum the forces from each pulling point on the anchor point.
-            for pull_pt in pull_pts:
-                # Get the distance from the pull pt to the anchor point.
-                dist_vec = pull_pt - anchor_pt
-
-                # Add the force on the anchor pin from the pulling pin.
-                net_force += dist_vec
+        anchor_pts = [get_placed_pt(pin) for pin in net_anchor_pins]
+        pull_pts = [get_placed_pt(pin) for pin in net_pull_pins]
+
+        # The net force is the sum of the distance vectors from each anchor point
+        # to each pulling point. Summing over every pair is the same as taking the
+        # sum of the pulling points times the number of anchor points minus the
+        # sum of the anchor points times the number of pulling points.
+        num_anchors, num_pulls = len(anchor_pts), len(pull_pts)
+        net_force_x = (
+            sum(pt.x for pt in pull_pts) * num_anchors
+            - sum(pt.x for pt in anchor_pts) * num_pulls
+        )
+        net_force_y = (
+            sum(pt.y for pt in pull_pts) * num_anchors
+            - sum(pt.y for pt in anchor_pts) * num_pulls
+        )
 
-                # Increment the normalizer for every pull force added to the net force.
-                pin_normalizer += 1
+        # There is one pull force for every anchor/pulling point pair.
+        pin_normalizer = num_anchors * num_pulls
 
-        if options.get("pin_normalize"):
+        if pin_normalize:
             # Normalize the net force across all the anchor & pull pins.
             pin_normalizer = pin_normalizer or 1  # Prevent div-by-zero.
-            net_force /= pin_normalizer
+            net_force_x /= pin_normalizer
+            net_force_y /= pin_normalizer
 
         # Accumulate force from this net into the total force on the part.
         # Multiply force if the net meets stated criteria.
-        total_force += net_force * force_mult
+        total_x += force_mult * net_force_x
+        total_y += force_mult * net_force_y
 
         # Increment the normalizer for every net force added to the total force.
         net_normalizer += 1
 
+    total_force = Vector(total_x, total_y)
+
     if options.get("net_normalize"):
         # Normalize the total force across all the nets.
         net_normalizer = net_normalizer or 1  # Prevent div-by-zero.
@@ -570,35 +686,48 @@ def overlap_force(part, parts, **options):
         Vector: Force upon given part.
     """
 
-    # Bounding box of given part.
-    part_bbox = part.place_bbox * part.tx
+    # Corners of the bounding box of the given part.
+    part_bbox = get_placed_bbox(part)
+    min_x, min_y = part_bbox.min.x, part_bbox.min.y
+    max_x, max_y = part_bbox.max.x, part_bbox.max.y
 
     # Compute the overlap force of the bbox of this part with every other part.
-    total_force = Vector(0, 0)
-    for other_part in set(parts) - {part}:
-        other_part_bbox = other_part.place_bbox * other_part.tx
+    # (The moves are computed from the bbox coordinates directly rather than
+    # with Points because this is done for every pair of parts.)
+    total_x, total_y = 0, 0
+    for other_part in parts:
+        if other_part is part:
+            continue
+        other_part_bbox = get_placed_bbox(other_part)
+        other_min, other_max = other_part_bbox.min, other_part_bbox.max
 
         # No force unless parts overlap.
-        if part_bbox.intersects(other_part_bbox):
+        if (
+            min_x < other_max.x
+            and max_x > other_min.x
+            and min_y < other_max.y
+            and max_y > other_min.y
+        ):
             # Compute the movement needed to separate the bboxes in left/right/up/down directions.
             # Add some small random offset to break symmetry when parts exactly overlay each other.
             # Move right edge of part to the left of other part's left edge, etc...
-            moves = []
-            rnd = Vector(random.random()-0.5, random.random()-0.5)
-            for edges, dir in ((("ll", "lr"), Vector(1,0)), (("ul", "ll"), Vector(0,1))):
-                move = (getattr(other_part_bbox, edges[0]) - getattr(part_bbox, edges[1]) - rnd) * dir
-                moves.append([move.magnitude, move])
-                # Flip edges...
-                move = (getattr(other_part_bbox, edges[1]) - getattr(part_bbox, edges[0]) - rnd) * dir
-                moves.append([move.magnitude, move])
-
-            # Select the smallest move that separates the parts.
-            move = min(moves, key=lambda m: m[0])
+            rnd_x = random.random() - 0.5
+            rnd_y = random.random() - 0.5
+            move_left = other_min.x - max_x - rnd_x
+            move_right = other_max.x - min_x - rnd_x
+            move_up = other_max.y - min_y - rnd_y
+            move_down = other_min.y - max_y - rnd_y
+
+            # Select the smallest move that separates the parts and add it to the
+            # total force on the part. Ties go to left, right, up and then down.
+            move_x = move_left if abs(move_left) <= abs(move_right) else move_right
+            move_y = move_up if abs(move_up) <= abs(move_down) else move_down
+            if abs(move_x) <= abs(move_y):
+                total_x += move_x
+            else:
+                total_y += move_y
 
-            # Add the move to the total force on the part.
-            total_force += move[1]
-                
-    return total_force
+    return Vector(total_x, total_y)
 
 
 @export_to_all
@@ -615,12 +744,14 @@ def overlap_force_rand(part, parts, **options):
     """
 
     # Bounding box of given part.
-    part_bbox = part.place_bbox * part.tx
+    part_bbox = get_placed_bbox(part)
 
     # Compute the overlap force of the bbox of this part with every other part.
     total_force = Vector(0, 0)
-    for other_part in set(parts) - {part}:
-        other_part_bbox = other_part.place_bbox * other_part.tx
+    for other_part in parts:
+        if other_part is part:
+            continue
+        other_part_bbox = get_placed_bbox(other_part)
 
         # No force unless parts overlap.
         if part_bbox.intersects(other_part_bbox):
@@ -724,11 +855,16 @@ def similarity_force(part, parts, similarity, **options):
     anchor_pt = part.anchor_pins["similarity"][0].place_pt * part.tx
 
     # Compute the combined force of all the similarity pulling points.
+    # Skip the pulling points on parts with no similarity since they exert no force.
+    part_similarity = similarity[part]
     total_force = Vector(0, 0)
     for pull_pin in part.pull_pins["similarity"]:
-        pull_pt = pull_pin.place_pt * pull_pin.part.tx
+        pin_similarity = part_similarity[pull_pin.part]
+        if not pin_similarity:
+            continue
+        pull_pt = get_placed_pt(pull_pin)
         # Force from pulling to anchor point is proportional to part similarity and distance.
-        total_force += (pull_pt - anchor_pt) * similarity[part][pull_pin.part]
+        total_force += (pull_pt - anchor_pt) * pin_similarity
 
     return total_force
 
@@ -783,7 +919,7 @@ def central_placement(parts, **options):
     # Collapse all the parts to the centroid.
     for part in parts:
         mv = ctr - part.place_bbox.ctr * part.tx
-        part.tx *= Tx(dx=mv.x, dy=mv.y)
+        part.tx = part.tx.move(mv)
 
 
 def random_placement(parts, **options):
@@ -904,7 +1040,7 @@ def push_and_pull(anchored_parts, mobile_parts, nets, force_func, **options):
             # Apply movements to part positions.
             for part in mobile_parts:
                 part.mv = part.force * speed
-                part.tx *= Tx(dx=part.mv.x, dy=part.mv.y)
+                part.tx = part.tx.move(part.mv)
 
             # Keep iterating until all the parts are still.
             if stable_threshold < 0:
@@ -1130,30 +1266,40 @@ class Placer:
 
         # Group all the parts that have some interconnection to each other.
         # Start with groups of parts on each individual net.
-        connected_parts = [
-            set(pin.part for pin in net.pins if pin.part in node.parts)
+        node_parts = set(node.parts)
+        net_parts = [
+            set(pin.part for pin in net.pins if pin.part in node_parts)
             for net in internal_nets
         ]
 
-        # Now join groups that have parts in common.
-        for i in range(len(connected_parts) - 1):
-            group1 = connected_parts[i]
-            for j in range(i + 1, len(connected_parts)):
-                group2 = connected_parts[j]
-                if group1 & group2:
-                    # If part groups intersect, collect union of parts into one group
-                    # and empty-out the other.
-                    connected_parts[j] = connected_parts[i] | connected_parts[j]
-                    connected_parts[i] = set()
-                    # No need to check against group1 any more since it has been
-                    # unioned into group2 that will be checked later in the loop.
-                    break
-
-        # Remove any empty groups that were unioned into other groups.
-        connected_parts = [group for group in connected_parts if group]
+        # Now join groups that have parts in common using a union-find over the nets.
+        # The root of each set of joined nets is the one that comes last in the list.
+        roots = list(range(len(net_parts)))
+
+        def find_root(i):
+            while roots[i] != i:
+                roots[i] = roots[roots[i]]  # Halve the path to the root as it's walked.
+                i = roots[i]
+            return i
+
+        part_nets = {}
+        for i, parts in enumerate(net_parts):
+            for part in parts:
+                # Join this net with the first net found with the same part.
+                root1, root2 = find_root(part_nets.setdefault(part, i)), find_root(i)
+                if root1 != root2:
+                    roots[min(root1, root2)] = max(root1, root2)
+
+        # Collect the union of the parts for each set of joined nets, skipping nets
+        # without any parts. Keep the groups in the order of their root nets.
+        groups = defaultdict(set)
+        for i, parts in enumerate(net_parts):
+            if parts:
+                groups[find_root(i)] |= parts
+        connected_parts = [groups[root] for root in sorted(groups)]
 
         # Find parts that aren't connected to anything.
-        floating_parts = set(node.parts) - set(itertools.chain(*connected_parts))
+        floating_parts = node_parts - set(itertools.chain(*connected_parts))
 
         return connected_parts, internal_nets, floating_parts
 
@@ -1246,16 +1392,16 @@ class Placer:
             )
 
         # For non-connected parts, do placement based on their similarity to each other.
+        # Similarity is symmetric, so it's only computed once for each pair of parts.
+        # (The similarity of a part to itself isn't computed at all.)
         part_similarity = defaultdict(lambda: defaultdict(lambda: 0))
-        for part in parts:
-            for other_part in parts:
-                # Don't compute similarity of a part to itself.
-                if other_part is part:
-                    continue
-
+        for i, part in enumerate(parts):
+            for other_part in parts[i + 1 :]:
                 # HACK: Get similarity forces right-sized.
-                part_similarity[part][other_part] = part.similarity(other_part) / 100
-                # part_similarity[part][other_part] = 0.1
+                similarity = part.similarity(other_part) / 100
+                # similarity = 0.1
+                part_similarity[part][other_part] = similarity
+                part_similarity[other_part][part] = similarity
 
             # Select the top-most pin in each part as the anchor point for force-directed placement.
             # tx = part.tx
@@ -1383,21 +1529,28 @@ class Placer:
         # and weaker links between blocks with adjacent tags. This ties similar
         # blocks together into "super blocks" and ties the super blocks into a linear
         # arrangement (1 -> 2 -> 3 ->...).
+        # The attraction between two blocks only depends on their tags, so find it
+        # once for each pair of tags.
+        tag_attr = {}
+        for i, tag in enumerate(tags):
+            for j, other_tag in enumerate(tags):
+                if i == j:
+                    # Large attraction between blocks of same type.
+                    tag_attr[tag, other_tag] = 1
+                elif abs(i - j) == 1:
+                    # Some attraction between blocks of adjacent types.
+                    tag_attr[tag, other_tag] = 0.1
+                else:
+                    # Otherwise, no attraction between these blocks.
+                    tag_attr[tag, other_tag] = 0
+
         blk_attr = defaultdict(lambda: defaultdict(lambda: 0))
         for blk in part_blocks:
             for other_blk in part_blocks:
                 if blk is other_blk:
                     # No attraction between a block and itself.
                     continue
-                if blk.tag == other_blk.tag:
-                    # Large attraction between blocks of same type.
-                    blk_attr[blk][other_blk] = 1
-                elif abs(tags.index(blk.tag) - tags.index(other_blk.tag)) == 1:
-                    # Some attraction between blocks of adjacent types.
-                    blk_attr[blk][other_blk] = 0.1
-                else:
-                    # Otherwise, no attraction between these blocks.
-                    blk_attr[blk][other_blk] = 0
+                blk_attr[blk][other_blk] = tag_attr[blk.tag, other_blk.tag]
 
         if not part_blocks:
             # Abort if nothing to place.
@@ -1435,13 +1588,25 @@ class Placer:
 
     def get_attrs(node):
         """Return dict of attribute sets for the parts, pins, and nets in a node."""
+
+        # The attributes of an object are those of its class plus those in its
+        # instance dict, so only call dir() once for each class of object.
+        class_attrs = {}
+
+        def add_attrs(attr_set, obj):
+            cls = type(obj)
+            if cls not in class_attrs:
+                class_attrs[cls] = set(dir(cls))
+            attr_set.update(class_attrs[cls])
+            attr_set.update(vars(obj))
+
         attrs = {"parts": set(), "pins": set(), "nets": set()}
         for part in node.parts:
-            attrs["parts"].update(set(dir(part)))
+            add_attrs(attrs["parts"], part)
             for pin in part.pins:
-                attrs["pins"].update(set(dir(pin)))
+                add_attrs(attrs["pins"], pin)
         for net in node.get_internal_nets():
-            attrs["nets"].update(set(dir(net)))
+            add_attrs(attrs["nets"], net)
         return attrs
 
     def show_added_attrs(node):
@@ -1456,10 +1621,10 @@ class Placer:
         """Remove attributes added to parts, pins, and nets of a node during the placement phase."""
 
         for part in node.parts:
-            rmv_attr(part.pins, ("route_pt", "place_pt"))
+            rmv_attr(part.pins, ("route_pt", "place_pt", "placed_pt"))
         rmv_attr(
             node.parts,
-            ("anchor_pins", "pull_pins", "pin_ctrs", "force", "mv"),
+            ("anchor_pins", "pull_pins", "pin_ctrs", "force", "mv", "placed_bbox"),
         )
         rmv_attr(node.get_internal_nets(), ("parts",))
 
@@ -1482,8 +1647,10 @@ class Placer:
 
         random.seed(options.get("seed"))
 
-        # Store the starting attributes of the node's parts, pins, and nets.
-        node.attrs = node.get_attrs()
+        if options.get("show_added_attrs"):
+            # Store the starting attributes of the node's parts, pins, and nets
+            # so the ones added during placement can be shown for debugging.
+            node.attrs = node.get_attrs()
 
         try:
             # First, recursively place children of this node.
@@ -1510,7 +1677,8 @@ class Placer:
             # Remove any stuff leftover from this place & route run.
             # print(f"added part attrs = {new_part_attrs}")
             node.rmv_placement_stuff()
-            # node.show_added_attrs()
+            if options.get("show_added_attrs"):
+                node.show_added_attrs()
 
             # Calculate the bounding box for the node after placement of parts and children.
             node.calc_bbox()
@@ -14,7 +14,9 @@ from __future__ import (  # isort:skip
 )
 
 import re
+import weakref
 from builtins import object, str
+from collections import OrderedDict
 
 try:
     from future import standard_library
@@ -28,13 +30,20 @@ from .utilities import (
     cnvt_to_var_name,
     export_to_all,
     filter_list,
-    flatten,
+    iter_flatten,
     list_or_scalar,
     opened,
     norecurse,
 )
 
 
+# Start a new, indented line at each part and pin of an exported library.
+_export_break_re = re.compile(r"Part\(|Pin\(")
+_export_indents = {"Part(": "\n        ", "Pin(": "\n            "}
+
+# Characters that make a search string into something other than a literal.
+_regex_metachars = set(".^$*+?{}[]\\|()")
+
 
 @export_to_all
 class SchLib(object):
@@ -55,9 +64,15 @@ class SchLib(object):
     """
 
     # Keep a dict of filenames and their associated SchLib object
-    # for fast loading of libraries.
+    # for fast loading of libraries. Only the most recently-loaded libraries
+    # are held by the cache; the others stay in it only while in use.
     # TODO: Find a way to retain the cache between invocations of SKiDL and only update new changed libraries.
-    _cache = {}
+    _cache = weakref.WeakValueDictionary()
+    _recent_libs = OrderedDict()
+    _max_recent_libs = 32
+
+    # Maximum number of part lookups remembered by each library.
+    _max_lookups = 1024
 
     def __init__(self, filename=None, tool=None, lib_section=None, **attribs):
         """
@@ -72,6 +87,10 @@ class SchLib(object):
 
         # Library starts off empty of parts.
         self.parts = []
+        # Parts found by previous lookups of their names.
+        self._lookups = OrderedDict()
+
+        cached_lib = self._cache.get(filename) if filename else None
 
         # Attach attributes to the library.
         for k, v in list(attribs.items()):
@@ -83,8 +102,13 @@ class SchLib(object):
 
         # Load this SchLib with an existing SchLib object if the file name
         # matches one in the cache.
-        elif filename in self._cache:
-            self.__dict__.update(self._cache[filename].__dict__)
+        elif cached_lib is not None:
+            self.__dict__.update(cached_lib.__dict__)
+            # Index the parts and remember lookups separately for each library.
+            for attr in ("_part_index", "_folded_part_index", "_part_index_len"):
+                self.__dict__.pop(attr, None)
+            self._lookups = OrderedDict()
+            self._cache_lib(filename, cached_lib)
 
         # Otherwise, load from a schematic library file.
         else:
@@ -98,7 +122,7 @@ class SchLib(object):
                 )
                 self.filename = filename
                 # Cache a reference to the library.
-                self._cache[filename] = self
+                self._cache_lib(filename, self)
             else:
                 # OK, that didn't work so well...
                 active_logger.raise_(
@@ -129,23 +153,99 @@ class SchLib(object):
     @classmethod
     def reset(cls):
         """Clear the cache of processed library files."""
-        cls._cache = {}
+        cls._cache = weakref.WeakValueDictionary()
+        cls._recent_libs = OrderedDict()
 
-    def add_parts(self, *parts):
-        """Add one or more parts to a library."""
+    @classmethod
+    def _cache_lib(cls, filename, lib):
+        """Store a library in the cache and mark it as recently used."""
+        cls._cache[filename] = lib
+        # Re-insert the library to move it to the end of the list.
+        cls._recent_libs.pop(filename, None)
+        cls._recent_libs[filename] = lib
+        while len(cls._recent_libs) > cls._max_recent_libs:
+            cls._recent_libs.popitem(last=False)
+
+    def add_parts(self, *parts, **kwargs):
+        """
+        Add one or more parts to a library.
+
+        Args:
+            parts: One or more parts or lists of parts.
+
+        Keyword Args:
+            copy: If false, store the parts themselves instead of template
+                copies of them. Only use this for parts that were just
+                created for this library and aren't used anywhere else.
+        """
 
         from .part import TEMPLATE
 
-        for part in flatten(parts):
+        copy = kwargs.pop("copy", True)
+
+        num_parts = len(self.parts)
+        for part in iter_flatten(parts):
             # Parts with the same name are not allowed in the library.
-            if not self.get_parts_by_name(
-                part.name, be_thorough=False, allow_failure=True
-            ):
-                self.parts.append(part.copy(dest=TEMPLATE))
-                # Place a pointer to this library into the added part.
-                self.parts[-1].lib = self
+            # Check the index directly since get_parts_by_name() would also
+            # parse the part that's already there.
+            name = part.name
+            if self.get_parts_quick(Alias(name, name.lower(), name.upper())):
+                continue
+            self.parts.append(part.copy(dest=TEMPLATE) if copy else part)
+            # Place a pointer to this library into the added part.
+            self.parts[-1].lib = self
+            # Add the new part to the name/alias index.
+            self._index_part(len(self.parts) - 1)
+        if len(self.parts) != num_parts:
+            self._clear_lookup_cache()
         return self
 
+    def _get_part_index(self):
+        """
+        Return a dict that maps each part name and alias to the positions
+        of the parts having it in the part list.
+
+        The index is rebuilt when the part list changes length outside
+        of add_parts (e.g., if parts are removed from the library) or
+        when the name or aliases of a part in the library are changed.
+        """
+        if getattr(self, "_part_index_len", None) != len(self.parts):
+            self._part_index = {}
+            self._folded_part_index = {}
+            self._part_index_len = 0
+            self._clear_lookup_cache()
+            for i in range(len(self.parts)):
+                self._index_part(i)
+        return self._part_index
+
+    def _index_part(self, i):
+        """Add the part at position i of the part list to the part index."""
+        if getattr(self, "_part_index_len", None) != i:
+            # Index is stale, so let _get_part_index() rebuild it.
+            return
+        for alias in self.parts[i].aliases:
+            self._part_index.setdefault(alias, []).append(i)
+            folded = str(alias).lower()
+            self._folded_part_index.setdefault(folded, []).append(i)
+        self._part_index_len = i + 1
+
+    def _clear_lookup_cache(self):
+        """Forget the results of previous part lookups."""
+        self._lookups.clear()
+
+    def _find_parts(self, name, be_thorough):
+        """Return a list of the parts in this library with the given name or alias."""
+
+        # Start with a simple search for the part name.
+        names = Alias(name, name.lower(), name.upper())
+        parts = self.get_parts_quick(names)
+
+        # Simple search failed, so try the more thorough search method.
+        if not parts and be_thorough:
+            parts = self.get_parts(use_backup_lib=False, aliases=name)
+
+        return parts
+
     def get_parts(self, use_backup_lib=True, **criteria):
         """
         Return parts from a library that match *all* the given criteria.
@@ -159,20 +259,48 @@ class SchLib(object):
             A list of Parts that match all the criteria.
         """
 
+        parts = []
+        alias = criteria.get("aliases")
+        if isinstance(alias, basestring) and not _regex_metachars.intersection(alias):
+            # A plain string always matches the whole alias ignoring case,
+            # so only the parts with it in the index have to be checked.
+            self._get_part_index()
+            posns = self._folded_part_index.get(alias.lower(), ())
+            parts = filter_list([self.parts[i] for i in posns], **criteria)
+        if not parts:
+            # Check all the parts in case one had its aliases changed in
+            # place so the index doesn't show it.
+            parts = filter_list(self.parts, **criteria)
+        if not parts and use_backup_lib:
+            parts = self._get_backup_parts(**criteria)
+        return parts
+
+    def _get_backup_parts(self, **criteria):
+        """Return parts from the backup library that match all the criteria."""
+
         import skidl
 
-        parts = filter_list(self.parts, **criteria)
-        if not parts and use_backup_lib and skidl.config.query_backup_lib:
+        if skidl.config.query_backup_lib:
             try:
                 backup_lib = load_backup_lib()
-                parts = backup_lib.get_parts(use_backup_lib=False, **criteria)
+                return backup_lib.get_parts(use_backup_lib=False, **criteria)
             except AttributeError:
                 pass
-        return parts
+        return []
 
     def get_parts_quick(self, name):
         """Do a quick search for a part name or alias."""
-        return [prt for prt in self.parts if prt.aliases == name]
+        # Callers usually pass an Alias already, so don't copy it.
+        names = name if isinstance(name, Alias) else Alias(name)
+        index = self._get_part_index()
+        posns = set()
+        for nm in names:
+            posns.update(index.get(nm, ()))
+        # Return parts in library order, rechecking them in case their
+        # aliases changed after they were indexed. This is the same test
+        # as prt.aliases == name without making a new Alias for each part.
+        parts = (self.parts[i] for i in sorted(posns))
+        return [prt for prt in parts if not names.isdisjoint(prt.aliases)]
 
     def get_parts_by_name(
         self,
@@ -198,13 +326,25 @@ class SchLib(object):
             A list of Parts that match all the criteria.
         """
 
-        # Start with a simple search for the part name.
-        names = Alias(name, name.lower(), name.upper())
-        parts = self.get_parts_quick(names)
-
-        # Simple search failed, so try the more thorough search method.
+        # The same part is often looked up for each of its instances, so
+        # remember the parts found in this library until its index changes.
+        # Failed searches aren't remembered since the part may be added later.
+        self._get_part_index()  # Clears the lookups if the index is rebuilt.
+        key = (name, be_thorough)
+        try:
+            # Re-insert the lookup to mark it as the most recently used one.
+            parts = self._lookups[key] = self._lookups.pop(key)
+        except KeyError:
+            parts = self._find_parts(name, be_thorough)
+            if parts:
+                self._lookups[key] = parts
+                if len(self._lookups) > self._max_lookups:
+                    self._lookups.popitem(last=False)
+        parts = list(parts)
+
+        # Not in this library, so look in the backup library.
         if not parts and be_thorough:
-            parts = self.get_parts(aliases=name)
+            parts = self._get_backup_parts(aliases=name)
 
         # No parts found, so signal an error.
         if not parts and not allow_failure:
@@ -242,9 +382,9 @@ class SchLib(object):
 
         def prettify(s):
             """Breakup and indent library export string."""
-            s = re.sub(r"(Part\()", r"\n        \1", s)
-            s = re.sub(r"(Pin\()", r"\n            \1", s)
-            return s
+            return _export_break_re.sub(
+                lambda m: _export_indents[m.group(0)] + m.group(0), s
+            )
 
         from skidl import SKIDL
         from skidl.tools import lib_suffixes
@@ -257,13 +397,19 @@ class SchLib(object):
         export_str = "from collections import defaultdict\n"
         export_str += "from skidl import Pin, Part, Alias, SchLib, SKIDL, TEMPLATE\n\n"
         export_str += "SKIDL_lib_version = '0.0.1'\n\n"
-        part_export_str = ",".join([p.export() for p in self.parts])
-        export_str += "{} = SchLib(tool=SKIDL).add_parts(*[{}])".format(
-            cnvt_to_var_name(libname), part_export_str
+        export_str += "{} = SchLib(tool=SKIDL).add_parts(*[".format(
+            cnvt_to_var_name(libname)
         )
-        export_str = prettify(export_str)
+
+        # Write the parts one at a time instead of building the whole
+        # library as a single string.
         with opened(file_, "w") as f:
             f.write(export_str)
+            for i, p in enumerate(self.parts):
+                if i:
+                    f.write(",")
+                f.write(prettify(p.export()))
+            f.write("])")
 
 
 @export_to_all
@@ -157,6 +157,7 @@ class SkidlBaseObject(object):
             self._name = None
         except AttributeError:
             pass
+        self._aliases_changed()
 
     @property
     def aliases(self):
@@ -170,6 +171,7 @@ class SkidlBaseObject(object):
         if not name_or_list:
             return
         self._aliases = Alias(name_or_list)
+        self._aliases_changed()
 
     @aliases.deleter
     def aliases(self):
@@ -177,6 +179,14 @@ class SkidlBaseObject(object):
             del self._aliases
         except AttributeError:
             pass
+        self._aliases_changed()
+
+    def _aliases_changed(self):
+        """Make the library holding this part rebuild its index of part names."""
+        # Look in __dict__ so parts don't search their pins for a missing lib.
+        lib = self.__dict__.get("lib")
+        if lib is not None:
+            lib._part_index_len = None
 
     @property
     def notes(self):
@@ -163,7 +163,8 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
                 datasheet="",
                 description="",
                 search_text="",
-            )
+            ),
+            copy=False,
         )
 
     # Now add information from any associated DCM file.
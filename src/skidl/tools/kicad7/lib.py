@@ -197,7 +197,8 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
                 datasheet=datasheet,
                 description=description,
                 search_text=search_text,
-            )
+            ),
+            copy=False,
         )
 
 
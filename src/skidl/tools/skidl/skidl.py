@@ -54,6 +54,64 @@ def get_fp_lib_tbl_dir():
     return "" # No global fp-lib-table file for SKiDL.
 
 
+def _compile_lib(contents, path):
+    """
+    Return the compiled code for the contents of a SKiDL library file.
+
+    The compiled code is cached in the __pycache__ directory alongside the
+    library file so it only has to be compiled again when the file changes.
+
+    Args:
+        contents: The Python code stored in the library file.
+        path: The path of the library file.
+    """
+
+    import marshal
+
+    from skidl.utilities import is_url
+
+    try:
+        from importlib.util import cache_from_source
+    except ImportError:
+        # Python 2 has no place to cache the code, so just compile it.
+        return compile(contents, path, "exec")
+
+    # Libraries that don't come from a local file can't be cached.
+    if is_url(path):
+        return compile(contents, path, "exec")
+
+    try:
+        stat = os.stat(path)
+        # Python versions before 3.5 can't tag the cache file, so don't use it.
+        cache_path = cache_from_source(path, optimization="sklib")
+    except (OSError, NotImplementedError, ValueError, TypeError):
+        return compile(contents, path, "exec")
+
+    # Use the cached code if it was compiled from the current library file.
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(cache_path, "rb") as fp:
+            cached_stamp, code = marshal.load(fp)
+        if tuple(cached_stamp) == stamp:
+            return code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    code = compile(contents, path, "exec")
+
+    # Store the compiled code. Failing to do so just means it's compiled again next time.
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = "{}.{}".format(cache_path, os.getpid())
+        with open(tmp_path, "wb") as fp:
+            marshal.dump((stamp, code), fp)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return code
+
+
 @export_to_all
 def load_sch_lib(self, filename=None, lib_search_paths_=None, lib_section=None):
     """
@@ -84,7 +142,8 @@ def load_sch_lib(self, filename=None, lib_search_paths_=None, lib_section=None):
         vars_ = {
             "__file__": path,
         }
-        exec(contents, vars_)  # Execute and store library in dict.
+        code = _compile_lib(contents, path)
+        exec(code, vars_)  # Execute and store library in dict.
 
         # Now look through the dict to find the library object.
         for val in vars_.values():
@@ -103,11 +162,31 @@ def load_sch_lib(self, filename=None, lib_search_paths_=None, lib_section=None):
 
 
 @export_to_all
-def parse_lib_part(self, partial_parse=False):  # pylint: disable=unused-argument
+def parse_lib_part(self, partial_parse=False):
     """
     Create a Part using a part definition from a SKiDL library.
+
+    Args:
+        partial_parse: If true, leave the part definition unparsed. The
+            rest of the definition will be parsed if the part is actually used.
     """
 
-    # Parts in a SKiDL library are already parsed and ready for use,
-    # so just return the part.
+    from skidl import Pin
+
+    # Parts in a SKiDL library are usually already parsed and ready for use.
+    # Parts with a deferred part definition only need their pins and the
+    # rest of their attributes filled in when they're used.
+    part_defn = getattr(self, "part_defn", None)
+    if not part_defn or partial_parse:
+        return self
+
+    for k, v in part_defn.items():
+        if k == "pins":
+            self.add_pins([Pin(**pin_attribs) for pin_attribs in v])
+        else:
+            setattr(self, k, v)
+
+    # Part definition is no longer needed.
+    self.part_defn = None
+
     return self
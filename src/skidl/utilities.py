@@ -181,6 +181,19 @@ def flatten(nested_list):
     return lst
 
 
+@export_to_all
+def iter_flatten(nested_list):
+    """
+    Yield the items from a nested list without building any intermediate lists.
+    """
+    for item in nested_list:
+        if isinstance(item, (list, tuple, set)):
+            for sub_item in iter_flatten(item):
+                yield sub_item
+        else:
+            yield item
+
+
 @export_to_all
 def set_attr(objs, attr, value):
     """Set an attribute in a list of objects."""
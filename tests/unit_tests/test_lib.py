@@ -2,7 +2,9 @@
 
 # The MIT License (MIT) - Copyright (c) Dave Vandenbout.
 
+import gc
 import os.path
+import weakref
 
 import pytest
 import sexpdata
@@ -50,7 +52,16 @@ def test_lib_import_1():
     assert len(lib) > 0
 
 
-def test_lib_export_1():
+def use_tmp_lib_dir(tmp_path, monkeypatch):
+    """Export SKiDL libraries to a temporary directory and load them from there."""
+    # Loading a SKiDL library caches its compiled code next to it, so keep
+    # both out of the test directory.
+    monkeypatch.chdir(tmp_path)
+    lib_search_paths[SKIDL].insert(0, str(tmp_path))
+
+
+def test_lib_export_1(tmp_path, monkeypatch):
+    use_tmp_lib_dir(tmp_path, monkeypatch)
     SchLib.reset()
     lib = SchLib("Device")
     lib.export("my_device", tool=SKIDL)
@@ -58,6 +69,47 @@ def test_lib_export_1():
     assert len(lib) == len(my_lib)
 
 
+def test_lib_export_2(tmp_path, monkeypatch):
+    use_tmp_lib_dir(tmp_path, monkeypatch)
+    SchLib.reset()
+    lib = SchLib("Device")
+    lib.export("my_device", tool=SKIDL)
+    SchLib.reset()
+    my_lib = SchLib("my_device", tool=SKIDL)  # Library code gets cached.
+    SchLib.reset()
+    my_lib = SchLib("my_device", tool=SKIDL)  # Library loaded from cached code.
+    assert len(lib) == len(my_lib)
+    # Changing the library file has to invalidate the cached code.
+    SchLib.reset()
+    lib = SchLib()
+    lib += SkidlPart(name="Q", dest=TEMPLATE)
+    lib.export("my_device", tool=SKIDL)
+    SchLib.reset()
+    my_lib = SchLib("my_device", tool=SKIDL)
+    assert len(my_lib) == 1
+
+
+def test_lib_cache_1(monkeypatch):
+    SchLib.reset()
+    monkeypatch.setattr(SchLib, "_max_recent_libs", 2)
+    device = weakref.ref(SchLib("Device"))
+    cmos = weakref.ref(SchLib("4xxx"))
+    # Recently loaded libraries are reused.
+    assert SchLib("Device").parts is device().parts
+    # Loading another library drops the least recently used one
+    # so it's reloaded the next time it's needed.
+    power = weakref.ref(SchLib("power"))
+    gc.collect()
+    assert cmos() is None
+    assert SchLib("Device").parts is device().parts
+    # Libraries that are still in use aren't reloaded.
+    in_use = SchLib("power")
+    SchLib("4xxx")
+    SchLib("Device")
+    gc.collect()
+    assert SchLib("power").parts is power().parts is in_use.parts
+
+
 def test_lib_creation_1():
     SchLib.reset()
     lib = SchLib()
@@ -126,7 +178,8 @@ def test_backup_3():
 
 
 
-def test_lib_1():
+def test_lib_1(tmp_path, monkeypatch):
+    use_tmp_lib_dir(tmp_path, monkeypatch)
     SchLib.reset()
     lib_kicad = SchLib("Device")
     lib_kicad.export("Device")
@@ -147,6 +200,139 @@ def test_lib_1():
     assert len(c.pins) == 2
 
 
+def test_pyspice_lib_1():
+    from skidl.tools.skidl.libs.pyspice_sklib import pyspice_lib
+
+    r = Part(pyspice_lib, "R", dest=TEMPLATE)
+    assert r.tool == SKIDL
+    assert r.ref_prefix == "R"
+    assert r.pyspice["name"] == "R"
+    assert len(r.pins) == 2
+    assert r["p"] is r["plus"]
+    m = Part(pyspice_lib, "mosfet", dest=TEMPLATE)
+    assert m.name == "M"
+    assert len(m.pins) == 4
+
+
+def test_pyspice_lib_2():
+    from skidl.tools.skidl.libs.pyspice_sklib import pyspice_lib
+
+    # SPICE element letters for the parts that aren't named by their letter.
+    ref_prefixes = {
+        "BEHAVCAP": "C",
+        "SEMICAP": "C",
+        "NONLINV": "E",
+        "NONLINI": "G",
+        "BEHAVIND": "L",
+        "BEHAVRES": "R",
+        "SEMIRES": "R",
+    }
+    for part in pyspice_lib.parts:
+        if len(part.name) == 1:
+            assert part.ref_prefix == part.name
+        elif part.name in ref_prefixes:
+            assert part.ref_prefix == ref_prefixes[part.name]
+        else:
+            # Independent sources like SINEV or PULSEI.
+            assert part.ref_prefix == part.name[-1]
+
+
+def test_pyspice_lib_3():
+    from skidl.tools.skidl.libs.pyspice_sklib import _PART_SPECS, pyspice_lib
+    from skidl.tools.spice import add_part_to_circuit
+
+    # Catch misspelled keys in the part specs and their pyspice dicts.
+    part_keys = {"name", "aliases", "keywords", "description", "ref_prefix"}
+    part_keys |= {"pyspice", "pins", "coupled_parts"}
+    pin_keys = {"num", "name", "func", "do_erc", "aliases"}
+    for spec in _PART_SPECS:
+        assert set(spec) <= part_keys
+        assert set(spec["pyspice"]) <= {"name", "kw", "add"}
+        for pin in spec.get("pins", ()):
+            assert set(pin) <= pin_keys
+    for part in pyspice_lib.parts:
+        part.parse()
+        if part.pyspice["add"] is add_part_to_circuit:
+            # Every pin has to map to a PySpice parameter.
+            kw = part.pyspice["kw"]
+            assert all(pin.name in kw for pin in part.pins)
+
+
+def test_lib_index_1():
+    lib = SchLib(tool=SKIDL)
+    for name in ("A", "b", "C"):
+        lib += Part(name=name, tool=SKIDL, dest=TEMPLATE)
+    # The part index has to track parts added or removed after it was built.
+    assert [p.name for p in lib.get_parts_by_name("a")] == ["A"]
+    assert [p.name for p in lib.get_parts_by_name("B")] == ["b"]
+    lib.parts.pop(0)
+    assert lib.get_parts_by_name("a", allow_failure=True) == []
+    assert [p.name for p in lib.get_parts_by_name("c")] == ["C"]
+    lib += Part(name="c", tool=SKIDL, dest=TEMPLATE)
+    assert len(lib) == 2
+
+
+def test_lib_index_2():
+    lib = SchLib(tool=SKIDL)
+    for name in ("RES", "R_small", "C"):
+        lib += Part(name=name, tool=SKIDL, dest=TEMPLATE)
+    # Plain strings use the index, others are still regular expressions.
+    assert [p.name for p in lib.get_parts(aliases="res")] == ["RES"]
+    assert [p.name for p in lib.get_parts(aliases="r_SMALL")] == ["R_small"]
+    assert [p.name for p in lib.get_parts(aliases="r.*")] == ["RES", "R_small"]
+    assert lib.get_parts(use_backup_lib=False, aliases="R") == []
+    # Other criteria are applied to the parts found in the index.
+    lib.parts[1].keywords = "smd"
+    assert [p.name for p in lib.get_parts(aliases="r_small", keywords="SMD")] == [
+        "R_small"
+    ]
+    assert lib.get_parts(use_backup_lib=False, aliases="res", keywords="smd") == []
+    # Aliases changed in place aren't in the index but are still found.
+    lib.parts[2].aliases.add("CAP")
+    assert [p.name for p in lib.get_parts(aliases="cap")] == ["C"]
+
+
+def test_lib_index_3():
+    lib = SchLib(tool=SKIDL)
+    lib += Part(name="FOO", tool=SKIDL, dest=TEMPLATE)
+    assert lib.get_parts_by_name("foo", allow_failure=True)
+    # Names and aliases changed after the part was indexed are found.
+    lib["FOO"].aliases += "BAR"
+    assert [p.name for p in lib.get_parts_quick("BAR")] == ["FOO"]
+    lib["FOO"].name = "BAZ"
+    assert [p.name for p in lib.get_parts(aliases="baz")] == ["BAZ"]
+    assert [p.name for p in lib.get_parts_by_name("BAZ")] == ["BAZ"]
+    assert lib.get_parts(use_backup_lib=False, aliases="foo") == []
+    lib += Part(name="BAZ", tool=SKIDL, dest=TEMPLATE)
+    assert len(lib) == 1
+
+
+def test_lib_add_parts_1():
+    lib = SchLib(tool=SKIDL)
+    a = Part(name="A", tool=SKIDL, dest=TEMPLATE)
+    b = Part(name="B", tool=SKIDL, dest=TEMPLATE)
+    lib.add_parts(a)
+    lib.add_parts(b, copy=False)
+    assert lib["A"] is not a
+    assert lib["B"] is b and b.lib is lib
+
+
+def test_lib_lookup_cache_1():
+    lib = SchLib(tool=SKIDL)
+    lib += Part(name="A", tool=SKIDL, dest=TEMPLATE)
+    # Lookups that failed before a part was added have to find it after.
+    assert lib.get_parts_by_name("x", allow_failure=True) == []
+    lib += Part(name="X", tool=SKIDL, dest=TEMPLATE)
+    assert [p.name for p in lib.get_parts_by_name("x")] == ["X"]
+    # Changing the returned list doesn't change the remembered results.
+    lib.get_parts_by_name("x").clear()
+    assert len(lib.get_parts_by_name("x")) == 1
+    # Renaming a part forgets the lookups that found it.
+    lib["X"].name = "Y"
+    assert lib.get_parts_by_name("x", allow_failure=True) == []
+    assert [p.name for p in lib.get_parts_by_name("y")] == ["Y"]
+
+
 def test_non_existing_lib_cannot_be_loaded():
     SchLib.reset()
     for tool in ALL_TOOLS:
@@ -1,4 +1,4 @@
-from skidl.utilities import is_url
+from skidl.utilities import flatten, is_url, iter_flatten
 
 
 def test_unix_paths_not_urls():
@@ -17,3 +17,8 @@ def test_windows_paths_not_urls():
 def test_http_https_are_url():
     assert is_url("http://example.com/resource")
     assert is_url("https://example.com/resouce")
+
+
+def test_iter_flatten_matches_flatten():
+    nested = [1, (2, [3, (4,)]), [], "ab", [[5]]]
+    assert list(iter_flatten(nested)) == flatten(nested) == [1, 2, 3, 4, "ab", 5]